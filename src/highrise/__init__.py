@@ -4,13 +4,27 @@ from __future__ import annotations
 from asyncio import Queue, sleep
 from collections import Counter
 from itertools import count
-from typing import TYPE_CHECKING, Any, Callable, Literal, Protocol, TypeVar, Union
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Any,
+    Callable,
+    Literal,
+    Protocol,
+    TypeVar,
+    Union,
+)
 
 from aiohttp import ClientWebSocketResponse
 from cattrs.preconf.json import make_converter
 from quattro import TaskGroup
 
-from ._unions import configure_tagged_union
+from ._lookups import configure_literal_lookup
+from ._unions import (
+    configure_key_probe_union,
+    configure_optional_unions,
+    configure_tagged_union,
+)
 from .models import (
     AnchorHitRequest,
     AnchorPosition,
@@ -18,25 +32,36 @@ from .models import (
     BuyRoomBoostRequest,
     BuyVoiceTimeRequest,
     ChangeBackpackRequest,
+    ChangeBackpackResponse,
     ChangeRoomPrivilegeRequest,
     ChannelEvent,
     ChannelRequest,
     ChatEvent,
     ChatRequest,
     CheckVoiceChatRequest,
+    CheckVoiceChatResponse,
     CurrencyItem,
     EmoteEvent,
     EmoteRequest,
     Error,
+    Facing,
     FloorHitRequest,
     GetBackpackRequest,
+    GetBackpackResponse,
     GetConversationsRequest,
+    GetConversationsResponse,
     GetInventoryRequest,
+    GetInventoryResponse,
     GetMessagesRequest,
+    GetMessagesResponse,
     GetRoomPrivilegeRequest,
     GetRoomUsersRequest,
+    GetRoomUsersResponse,
     GetUserOutfitRequest,
+    GetUserOutfitResponse,
     GetWalletRequest,
+    GetWalletResponse,
+    GoldBar,
     IndicatorRequest,
     InviteSpeakerRequest,
     Item,
@@ -44,8 +69,11 @@ from .models import (
     LeaveConversationRequest,
     MessageEvent,
     ModerateRoomRequest,
+    ModerationAction,
+    ModerationType,
     MoveUserToRoomRequest,
     Position,
+    RateLimit,
     Reaction,
     ReactionEvent,
     ReactionRequest,
@@ -64,11 +92,13 @@ from .models import (
     UserLeftEvent,
     UserMovedEvent,
     VoiceEvent,
+    VoiceStatus,
 )
-from .webapi import WebAPI
 
 if TYPE_CHECKING:
     from attrs import AttrsInstance
+
+    from .webapi import WebAPI
 else:
 
     class AttrsInstance(Protocol):
@@ -81,13 +111,27 @@ __all__ = [
     "User",
     "Position",
     "Reaction",
+    "GoldBar",
+    "ModerationAction",
+    "VoiceStatus",
+    "ModerationType",
     "AnchorPosition",
     "RoomPermissions",
+    "RateLimit",
 ]
 A = TypeVar("A", bound=AttrsInstance)
 T = TypeVar("T")
 
 
+def __getattr__(name: str) -> Any:
+    # The web API (and its pendulum dependency) is only imported when used.
+    if name == "WebAPI":
+        from .webapi import WebAPI
+
+        return WebAPI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 class BaseBot:
     """A base class for Highrise bots.
     Bots join a room and interact with everything in it.
@@ -155,7 +199,7 @@ class BaseBot:
         pass
 
     async def on_voice_change(
-        self, users: list[tuple[User, Literal["voice", "muted"]]], seconds_left: int
+        self, users: list[tuple[User, VoiceStatus]], seconds_left: int
     ) -> None:
         """On a change in voice status in the room."""
         pass
@@ -170,7 +214,7 @@ class BaseBot:
         self,
         moderator_id: str,
         target_user_id: str,
-        moderation_type: Literal["kick", "mute", "unmute", "ban", "unban"],
+        moderation_type: ModerationType,
         duration: int | None,
     ) -> None:
         """When room moderation event is triggered."""
@@ -216,8 +260,10 @@ class Highrise:
     async def set_indicator(self, icon: str | None) -> None:
         await _do_req_no_resp(self, IndicatorRequest(icon))
 
-    async def send_channel(self, message: str, tags: set[str] = set()) -> None:
-        await _do_req_no_resp(self, ChannelRequest(message, tags))
+    async def send_channel(
+        self, message: str, tags: AbstractSet[str] = frozenset()
+    ) -> None:
+        await _do_req_no_resp(self, ChannelRequest(message, set(tags)))
 
     async def walk_to(self, destination: Position | AnchorPosition) -> None:
         if isinstance(destination, AnchorPosition):
@@ -228,34 +274,28 @@ class Highrise:
     async def teleport(self, user_id: str, dest: Position) -> None:
         await _do_req_no_resp(self, TeleportRequest(user_id, dest))
 
-    async def get_room_users(self) -> GetRoomUsersRequest.GetRoomUsersResponse | Error:
-        req_id = str(next(self._req_id))
-        self._req_id_registry[req_id] = (q := Queue[Any](maxsize=1))
-        await self.ws.send_str(
-            converter.dumps(GetRoomUsersRequest(str(req_id)), Outgoing)
-        )
-        return await q.get()
+    async def get_room_users(self) -> GetRoomUsersResponse | Error:
+        """Fetch the list of users currently in the room, with their positions."""
+        return await do_req_resp(self, GetRoomUsersRequest())
 
-    async def get_wallet(self) -> GetWalletRequest.GetWalletResponse | Error:
+    async def get_wallet(self) -> GetWalletResponse | Error:
         """Fetch the bot wallet."""
         return await do_req_resp(self, GetWalletRequest())
 
-    async def get_backpack(
-        self, user_id: str
-    ) -> GetBackpackRequest.GetBackpackResponse | Error:
+    async def get_backpack(self, user_id: str) -> GetBackpackResponse | Error:
         """Fetch a user's backpack."""
         return await do_req_resp(self, GetBackpackRequest(user_id))
 
     async def change_backpack(
         self, user_id: str, changes: dict[str, int]
-    ) -> ChangeBackpackRequest.ChangeBackpackResponse | Error:
+    ) -> ChangeBackpackResponse | Error:
         """Change a user's backpack."""
         return await do_req_resp(self, ChangeBackpackRequest(user_id, Counter(changes)))
 
     async def moderate_room(
         self,
         user_id: str,
-        action: Literal["kick", "ban", "unban", "mute"],
+        action: ModerationAction,
         action_length: int | None = None,
     ) -> None:
         """Moderate a user in the room."""
@@ -287,7 +327,7 @@ class Highrise:
 
     async def get_voice_status(
         self,
-    ) -> CheckVoiceChatRequest.CheckVoiceChatResponse | Error:
+    ) -> CheckVoiceChatResponse | Error:
         """Fetch the voice status for the room."""
         return await do_req_resp(self, CheckVoiceChatRequest())
 
@@ -299,15 +339,13 @@ class Highrise:
         """Remove a user from voice chat."""
         await _do_req_no_resp(self, RemoveSpeakerRequest(user_id))
 
-    async def get_user_outfit(
-        self, user_id: str
-    ) -> GetUserOutfitRequest.GetUserOutfitResponse | Error:
+    async def get_user_outfit(self, user_id: str) -> GetUserOutfitResponse | Error:
         """Fetch the outfit for a user."""
         return await do_req_resp(self, GetUserOutfitRequest(user_id))
 
     async def get_conversations(
         self, not_joined: bool = False, last_id: str | None = None
-    ) -> GetConversationsRequest.GetConversationsResponse | Error:
+    ) -> GetConversationsResponse | Error:
         """Fetch the conversations for the bot."""
         return await do_req_resp(self, GetConversationsRequest(not_joined, last_id))
 
@@ -349,7 +387,7 @@ class Highrise:
 
     async def get_messages(
         self, conversation_id: str, last_id: str | None = None
-    ) -> GetMessagesRequest.GetMessagesResponse | Error:
+    ) -> GetMessagesResponse | Error:
         """Fetch messages from a conversation."""
         return await do_req_resp(self, GetMessagesRequest(conversation_id, last_id))
 
@@ -381,17 +419,7 @@ class Highrise:
     async def tip_user(
         self,
         user_id: str,
-        tip: Literal[
-            "gold_bar_1",
-            "gold_bar_5",
-            "gold_bar_10",
-            "gold_bar_50",
-            "gold_bar_100",
-            "gold_bar_500",
-            "gold_bar_1k",
-            "gold_bar_5000",
-            "gold_bar_10k",
-        ],
+        tip: GoldBar,
     ) -> Literal["success", "insufficient_funds"] | Error:
         """Tip a user."""
         res = await do_req_resp(self, TipUserRequest(user_id, tip))
@@ -399,14 +427,14 @@ class Highrise:
             return res
         return res.result
 
-    async def get_my_outfit(self) -> GetUserOutfitRequest.GetUserOutfitResponse | Error:
+    async def get_my_outfit(self) -> GetUserOutfitResponse | Error:
         """Get the bot's outfit."""
         res = await do_req_resp(self, GetUserOutfitRequest(self.my_id))
         if isinstance(res, Error):
             return res
         return res
 
-    async def get_inventory(self) -> GetInventoryRequest.GetInventoryResponse | Error:
+    async def get_inventory(self) -> GetInventoryResponse | Error:
         """Get the bot's inventory."""
         res = await do_req_resp(self, GetInventoryRequest())
         if isinstance(res, Error):
@@ -475,7 +503,7 @@ async def _delayed_callback(callback: Callable, delay: float) -> None:
     await callback()
 
 
-converter = make_converter()
+converter = make_converter(detailed_validation=False)
 
 Outgoing = (
     ChatRequest
@@ -530,6 +558,15 @@ IncomingEvents = (
 Incoming = IncomingEvents | Union[tuple(r.Response for r in Outgoing.__args__)]  # type: ignore
 
 
+configure_optional_unions(converter)
+configure_literal_lookup(Reaction, converter)
+configure_literal_lookup(Facing, converter)
+configure_literal_lookup(VoiceStatus, converter)
+configure_literal_lookup(ModerationType, converter)
+configure_key_probe_union(Position | AnchorPosition, "entity_id", converter)
+converter.register_structure_hook(
+    RateLimit, lambda v, _: RateLimit(int(v[0]), float(v[1]))
+)
 configure_tagged_union(SessionMetadata | Error, converter)
 configure_tagged_union(Incoming, converter)
 configure_tagged_union(Outgoing, converter)
@@ -103,7 +103,7 @@ async def main(definitions: list[BotDefinition]) -> None:
 
 
 async def bot_runner(bot: BaseBot, room_id: str, api_key: str) -> None:
-    async with TaskGroup() as tg:
+    async with WebAPI() as webapi, TaskGroup() as tg:
         t = throttler(5, 5)
         while True:
             await anext(t)
@@ -141,7 +141,6 @@ async def bot_runner(bot: BaseBot, room_id: str, api_key: str) -> None:
                             ka_task.cancel()
                             return
                         bot_id = str(session_metadata.user_id)
-                        webapi = WebAPI()
                         chat = Highrise()
                         chat.my_id = bot_id
                         chat.ws = ws
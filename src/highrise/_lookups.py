@@ -0,0 +1,47 @@
+from enum import Enum
+from typing import Any, Type
+
+from cattrs import Converter
+
+__all__ = ["configure_literal_lookup", "configure_enum_lookup"]
+
+
+def configure_literal_lookup(literal: Any, converter: Converter) -> None:
+    """
+    Configure the converter so that `literal` (which should be a `Literal`)
+    is structured with a single dict lookup instead of a scan of its
+    arguments.
+
+    The canonical value from the `Literal` definition is returned, so equal
+    payload values share one object.
+    """
+    lookup = {v: v for v in literal.__args__}
+
+    def structure_literal(val: Any, _: Any, _lookup: dict = lookup) -> Any:
+        try:
+            return _lookup[val]
+        except KeyError:
+            raise Exception(f"{val} not in literal {literal}") from None
+
+    converter.register_structure_hook_func(lambda t: t == literal, structure_literal)
+
+
+def configure_enum_lookup(enum: Type[Enum], converter: Converter) -> None:
+    """
+    Configure the converter so that `enum` is structured with a single dict
+    lookup from value to member, skipping `Enum.__call__`.
+
+    Unknown values fall back to calling the enum, so `_missing_` and the
+    `ValueError` for invalid values behave as before.
+    """
+    lookup = {m.value: m for m in enum}
+
+    def structure_enum(
+        val: Any, _: Any, _lookup: dict = lookup, _enum: Type[Enum] = enum
+    ) -> Enum:
+        try:
+            return _lookup[val]
+        except (KeyError, TypeError):
+            return _enum(val)
+
+    converter.register_structure_hook(enum, structure_enum)
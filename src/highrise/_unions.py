@@ -1,10 +1,18 @@
 from collections import defaultdict
 from typing import Any, Callable, Dict, Optional, Type
 
-from attrs import NOTHING
+from attrs import NOTHING, fields_dict
 from cattrs import Converter
+from cattrs._compat import is_union_type
 
-__all__ = ["default_tag_generator", "configure_tagged_union"]
+__all__ = [
+    "default_tag_generator",
+    "configure_tagged_union",
+    "configure_optional_unions",
+    "configure_key_probe_union",
+]
+
+NoneType = type(None)
 
 
 def default_tag_generator(typ: Type) -> str:
@@ -47,6 +55,9 @@ def configure_tagged_union(
 
         tag_to_hook[tag] = structure_union_member
     cl_to_tag = {cl: tag_generator(cl) for cl in args}
+    # Unstructure hooks are resolved on first use; most unions are only ever
+    # structured.
+    cl_to_unstructure: Dict[Type, Callable[[Any], Dict]] = {}
 
     if default is not NOTHING:
         default_handler = converter._structure_func.dispatch(default)
@@ -58,10 +69,19 @@ def configure_tagged_union(
         cl_to_tag = defaultdict(lambda: default, cl_to_tag)
 
     def unstructure_tagged_union(
-        val: union, _c=converter, _cl_to_tag=cl_to_tag, _tag_name=tag_name
+        val: union,
+        _c=converter,
+        _cl_to_tag=cl_to_tag,
+        _cl_to_unstructure=cl_to_unstructure,
+        _tag_name=tag_name,
     ) -> Dict:
-        res = _c.unstructure(val)
-        res[_tag_name] = _cl_to_tag[val.__class__]
+        cl = val.__class__
+        try:
+            handler = _cl_to_unstructure[cl]
+        except KeyError:
+            handler = _cl_to_unstructure[cl] = _c._unstructure_func.dispatch(cl)
+        res = handler(val)
+        res[_tag_name] = _cl_to_tag[cl]
         return res
 
     if default is NOTHING:
@@ -88,3 +108,56 @@ def configure_tagged_union(
 
     converter.register_unstructure_hook(union, unstructure_tagged_union)
     converter.register_structure_hook(union, structure_tagged_union)
+
+
+def configure_optional_unions(converter: Converter) -> None:
+    """
+    Configure the converter so that optional unions (`X | None`) are
+    structured with the hook for `X` resolved once, when the union is first
+    seen, instead of being dispatched on every call.
+    This should be applied before other hooks are generated, so they pick
+    it up.
+    """
+
+    def is_optional(typ: Any) -> bool:
+        return (
+            is_union_type(typ) and len(typ.__args__) == 2 and NoneType in typ.__args__
+        )
+
+    def gen_structure_optional(typ: Any) -> Callable[[Any, Any], Any]:
+        a, b = typ.__args__
+        other = b if a is NoneType else a
+        handler = converter._structure_func.dispatch(other)
+
+        def structure_optional(
+            val: Any, _: Any, _h: Callable[[Any, Any], Any] = handler, _cl: Any = other
+        ) -> Any:
+            if val is None:
+                return None
+            return _h(val, _cl)
+
+        return structure_optional
+
+    converter.register_structure_hook_factory(is_optional, gen_structure_optional)
+
+
+def configure_key_probe_union(union: Any, key: str, converter: Converter) -> None:
+    """
+    Configure the converter so that `union` (which should be a union of two
+    attrs classes, only one of which has a `key` attribute) is structured by
+    probing the payload for `key`, instead of cattrs' generic attrs-union
+    disambiguation followed by a full `structure` dispatch on every call.
+    """
+    a, b = union.__args__
+    keyed, other = (a, b) if key in fields_dict(a) else (b, a)
+    structure_keyed = converter._structure_func.dispatch(keyed)
+    structure_other = converter._structure_func.dispatch(other)
+
+    def structure_key_probe_union(val: dict, _: Any) -> Any:
+        if key in val:
+            return structure_keyed(val, keyed)
+        return structure_other(val, other)
+
+    converter.register_structure_hook_func(
+        lambda t: t == union, structure_key_probe_union
+    )
@@ -1,6 +1,6 @@
 from collections import Counter
 from datetime import datetime
-from typing import ClassVar, Literal, TypeAlias
+from typing import ClassVar, Literal, NamedTuple, TypeAlias
 
 from attrs import Factory, define
 
@@ -13,6 +13,20 @@ class User:
 
 Reaction: TypeAlias = Literal["clap", "heart", "thumbs", "wave", "wink"]
 Facing: TypeAlias = Literal["FrontRight", "FrontLeft", "BackRight", "BackLeft"]
+GoldBar: TypeAlias = Literal[
+    "gold_bar_1",
+    "gold_bar_5",
+    "gold_bar_10",
+    "gold_bar_50",
+    "gold_bar_100",
+    "gold_bar_500",
+    "gold_bar_1k",
+    "gold_bar_5000",
+    "gold_bar_10k",
+]
+ModerationAction: TypeAlias = Literal["kick", "ban", "unban", "mute"]
+ModerationType: TypeAlias = Literal["kick", "mute", "unmute", "ban", "unban"]
+VoiceStatus: TypeAlias = Literal["voice", "muted"]
 
 
 @define
@@ -106,7 +120,14 @@ class Error:
     rid: str | None = None
 
 
-@define
+@define(eq=False)
+class ChatResponse:
+    """The successful response to a `ChatRequest`."""
+
+    rid: str | None = None
+
+
+@define(eq=False)
 class ChatRequest:
     """
     Send a chat message to a room.
@@ -118,27 +139,32 @@ class ChatRequest:
     whisper_target_id: str | None = None
     rid: str | None = None
 
-    @define
-    class ChatResponse:
-        rid: str | None = None
-        """The successful response to a `ChatRequest`."""
-
+    ChatResponse: ClassVar = ChatResponse
     Response: ClassVar = ChatResponse
 
 
-@define
+@define(eq=False)
+class IndicatorResponse:
+    rid: str | None = None
+
+
+@define(eq=False)
 class IndicatorRequest:
     icon: str | None = None
     rid: str | None = None
 
-    @define
-    class IndicatorResponse:
-        rid: str | None = None
-
+    IndicatorResponse: ClassVar = IndicatorResponse
     Response: ClassVar = IndicatorResponse
 
 
-@define
+@define(eq=False)
+class ChannelResponse:
+    """The successful response to a `ChannelRequest."""
+
+    rid: str | None = None
+
+
+@define(eq=False)
 class ChannelRequest:
     """
     Send a hidden channel message to the room.
@@ -152,16 +178,18 @@ class ChannelRequest:
     only_to: set[str] | None = None
     rid: str | None = None
 
-    @define
-    class ChannelResponse:
-        """The successful response to a `ChannelRequest."""
+    ChannelResponse: ClassVar = ChannelResponse
+    Response: ClassVar = ChannelResponse
 
-        rid: str | None = None
 
-    Response: ClassVar = ChannelResponse
+@define(eq=False)
+class EmoteResponse:
+    """The successful response to a `EmoteRequest`."""
 
+    rid: str | None = None
 
-@define
+
+@define(eq=False)
 class EmoteRequest:
     """
     Perform an emote.
@@ -173,16 +201,20 @@ class EmoteRequest:
     target_user_id: str | None = None
     rid: str | None = None
 
-    @define
-    class EmoteResponse:
-        """The successful response to a `EmoteRequest`."""
+    EmoteResponse: ClassVar = EmoteResponse
+    Response: ClassVar = EmoteResponse
 
-        rid: str | None = None
 
-    Response: ClassVar = EmoteResponse
+@define(eq=False)
+class ReactionResponse:
+    """
+    A response to a successful reaction.
+    """
 
+    rid: str | None = None
 
-@define
+
+@define(eq=False)
 class ReactionRequest:
     """
     Send a reaction to a user.
@@ -192,18 +224,20 @@ class ReactionRequest:
     target_user_id: str
     rid: str | None = None
 
-    @define
-    class ReactionResponse:
-        """
-        A response to a successful reaction.
-        """
+    ReactionResponse: ClassVar = ReactionResponse
+    Response: ClassVar = ReactionResponse
 
-        rid: str | None = None
 
-    Response: ClassVar = ReactionResponse
+@define(eq=False)
+class KeepaliveResponse:
+    """
+    A response to a successful reaction.
+    """
 
+    rid: str | None = None
 
-@define
+
+@define(eq=False)
 class KeepaliveRequest:
     """
     Send a keepalive request.
@@ -213,18 +247,18 @@ class KeepaliveRequest:
 
     rid: str | None = None
 
-    @define
-    class KeepaliveResponse:
-        """
-        A response to a successful reaction.
-        """
+    KeepaliveResponse: ClassVar = KeepaliveResponse
+    Response: ClassVar = KeepaliveResponse
 
-        rid: str | None = None
 
-    Response: ClassVar = KeepaliveResponse
+@define(eq=False)
+class TeleportResponse:
+    """The successful response to a `TeleportRequest`."""
 
+    rid: str | None = None
 
-@define
+
+@define(eq=False)
 class TeleportRequest:
     """
     Teleport the provided `user_id` to the provided `destination`.
@@ -235,16 +269,18 @@ class TeleportRequest:
     destination: Position
     rid: str | None = None
 
-    @define
-    class TeleportResponse:
-        """The successful response to a `TeleportRequest`."""
+    TeleportResponse: ClassVar = TeleportResponse
+    Response: ClassVar = TeleportResponse
 
-        rid: str | None = None
 
-    Response: ClassVar = TeleportResponse
+@define(eq=False)
+class FloorHitResponse:
+    """The successful response to a `TeleportRequest`."""
+
+    rid: str | None = None
 
 
-@define
+@define(eq=False)
 class FloorHitRequest:
     """
     Move the bot to the given `destination`.
@@ -254,16 +290,18 @@ class FloorHitRequest:
     destination: Position
     rid: str | None = None
 
-    @define
-    class FloorHitResponse:
-        """The successful response to a `TeleportRequest`."""
+    FloorHitResponse: ClassVar = FloorHitResponse
+    Response: ClassVar = FloorHitResponse
 
-        rid: str | None = None
 
-    Response: ClassVar = FloorHitResponse
+@define(eq=False)
+class AnchorHitResponse:
+    """The successful response to a `TeleportRequest`."""
 
+    rid: str | None = None
 
-@define
+
+@define(eq=False)
 class AnchorHitRequest:
     """
     Move the bot to the given `destination`.
@@ -273,38 +311,45 @@ class AnchorHitRequest:
     anchor: AnchorPosition
     rid: str | None = None
 
-    @define
-    class AnchorHitResponse:
-        """The successful response to a `TeleportRequest`."""
+    AnchorHitResponse: ClassVar = AnchorHitResponse
+    Response: ClassVar = AnchorHitResponse
+
 
-        rid: str | None = None
+@define(eq=False)
+class GetRoomUsersResponse:
+    """
+    The list of users in the room, alongside their positions.
 
-    Response: ClassVar = AnchorHitResponse
+    """
+
+    content: list[tuple[User, Position | AnchorPosition]]
+    rid: str
 
 
-@define
+@define(eq=False)
 class GetRoomUsersRequest:
     """
     Fetch the list of users currently in the room, with their positions.
 
     """
 
-    rid: str
+    rid: str | None = None
 
-    @define
-    class GetRoomUsersResponse:
-        """
-        The list of users in the room, alongside their positions.
+    GetRoomUsersResponse: ClassVar = GetRoomUsersResponse
+    Response: ClassVar = GetRoomUsersResponse
 
-        """
 
-        content: list[tuple[User, Position | AnchorPosition]]
-        rid: str
+@define(eq=False)
+class GetWalletResponse:
+    """
+    The bot's wallet.
+    """
 
-    Response: ClassVar = GetRoomUsersResponse
+    content: list[CurrencyItem]
+    rid: str
 
 
-@define
+@define(eq=False)
 class GetWalletRequest:
     """
     Fetch the bot's wallet.
@@ -314,19 +359,20 @@ class GetWalletRequest:
 
     rid: str | None = None
 
-    @define
-    class GetWalletResponse:
-        """
-        The bot's wallet.
-        """
+    GetWalletResponse: ClassVar = GetWalletResponse
+    Response: ClassVar = GetWalletResponse
 
-        content: list[CurrencyItem]
-        rid: str
 
-    Response: ClassVar = GetWalletResponse
+@define(eq=False)
+class ModerateRoomResponse:
+    """
+    The successful response to a `ModerateRoomRequest`.
+    """
 
+    rid: str | None = None
 
-@define
+
+@define(eq=False)
 class ModerateRoomRequest:
     """
     Moderate the room.
@@ -335,22 +381,25 @@ class ModerateRoomRequest:
     """
 
     user_id: str
-    moderation_action: Literal["kick", "ban", "unban", "mute"]
+    moderation_action: ModerationAction
     action_length: int | None = None
     rid: str | None = None
 
-    @define
-    class ModerateRoomResponse:
-        """
-        The successful response to a `ModerateRoomRequest`.
-        """
+    ModerateRoomResponse: ClassVar = ModerateRoomResponse
+    Response: ClassVar = ModerateRoomResponse
 
-        rid: str | None = None
 
-    Response: ClassVar = ModerateRoomResponse
+@define(eq=False)
+class GetRoomPrivilegeResponse:
+    """
+    The room privileges for provided `user_id`.
+    """
+
+    content: RoomPermissions
+    rid: str
 
 
-@define
+@define(eq=False)
 class GetRoomPrivilegeRequest:
     """
     Fetch the room privileges for provided `user_id`.
@@ -359,19 +408,20 @@ class GetRoomPrivilegeRequest:
     user_id: str
     rid: str | None = None
 
-    @define
-    class GetRoomPrivilegeResponse:
-        """
-        The room privileges for provided `user_id`.
-        """
+    GetRoomPrivilegeResponse: ClassVar = GetRoomPrivilegeResponse
+    Response: ClassVar = GetRoomPrivilegeResponse
+
 
-        content: RoomPermissions
-        rid: str
+@define(eq=False)
+class ChangeRoomPrivilegeResponse:
+    """
+    The successful response to a `ChangeRoomPrivilegeRequest`.
+    """
 
-    Response: ClassVar = GetRoomPrivilegeResponse
+    rid: str
 
 
-@define
+@define(eq=False)
 class ChangeRoomPrivilegeRequest:
     """
     Change the room privileges for provided `user_id`.
@@ -385,18 +435,16 @@ class ChangeRoomPrivilegeRequest:
     permissions: RoomPermissions
     rid: str | None = None
 
-    @define
-    class ChangeRoomPrivilegeResponse:
-        """
-        The successful response to a `ChangeRoomPrivilegeRequest`.
-        """
+    ChangeRoomPrivilegeResponse: ClassVar = ChangeRoomPrivilegeResponse
+    Response: ClassVar = ChangeRoomPrivilegeResponse
 
-        rid: str
 
-    Response: ClassVar = ChangeRoomPrivilegeResponse
+@define(eq=False)
+class MoveUserToRoomResponse:
+    rid: str
 
 
-@define
+@define(eq=False)
 class MoveUserToRoomRequest:
     """
     Move user to another room using room_id as a target room id
@@ -412,10 +460,7 @@ class MoveUserToRoomRequest:
 
     rid: str | None = None
 
-    @define
-    class MoveUserToRoomResponse:
-        rid: str
-
+    MoveUserToRoomResponse: ClassVar = MoveUserToRoomResponse
     Response: ClassVar = MoveUserToRoomResponse
 
 
@@ -429,7 +474,13 @@ class RoomInfo:
     room_name: str
 
 
-@define
+@define(eq=False)
+class GetBackpackResponse:
+    backpack: Counter[str]
+    rid: str | None = None
+
+
+@define(eq=False)
 class GetBackpackRequest:
     """
     Fetch a user's world backpack.
@@ -438,27 +489,36 @@ class GetBackpackRequest:
     user_id: str
     rid: str | None = None
 
-    @define
-    class GetBackpackResponse:
-        backpack: Counter[str]
-        rid: str | None = None
-
+    GetBackpackResponse: ClassVar = GetBackpackResponse
     Response: ClassVar = GetBackpackResponse
 
 
-@define
+@define(eq=False)
+class ChangeBackpackResponse:
+    rid: str | None = None
+
+
+@define(eq=False)
 class ChangeBackpackRequest:
     user_id: str
     changes: Counter[str]
     rid: str | None = None
 
-    @define
-    class ChangeBackpackResponse:
-        rid: str | None = None
-
+    ChangeBackpackResponse: ClassVar = ChangeBackpackResponse
     Response: ClassVar = ChangeBackpackResponse
 
 
+class RateLimit(NamedTuple):
+    """
+    A rate limit: at most `limit` requests per `period` seconds.
+
+    This is a tuple, so it can still be unpacked as `(limit, period)`.
+    """
+
+    limit: int
+    period: float
+
+
 @define
 class SessionMetadata:
     """
@@ -467,8 +527,8 @@ class SessionMetadata:
     This will be sent once, as the first message when a connection is established.
     user_id is the bot's user id.
     room_info is additional information about the connected room.
-    rate_limits is a dictionary of rate limits, with the key being the rate limit name and the value being a tuple of
-    (limit, period).
+    rate_limits is a dictionary of rate limits, with the key being the rate limit name and the value being a
+    `RateLimit` tuple of (limit, period).
     connection_id is the connection id of the websocket used in bot connection.
     sdk_versions is a string containing the SDK versions recommended by the server if user is using SDK.
 
@@ -477,12 +537,12 @@ class SessionMetadata:
 
     user_id: str
     room_info: RoomInfo
-    rate_limits: dict[str, tuple[int, float]]
+    rate_limits: dict[str, RateLimit]
     connection_id: str
     sdk_version: str | None = None
 
 
-@define
+@define(eq=False)
 class ChatEvent:
     """
     A chat event, sent by a `user` in the room.
@@ -493,7 +553,7 @@ class ChatEvent:
     whisper: bool
 
 
-@define
+@define(eq=False)
 class EmoteEvent:
     """
     An emote event, performed by a `user` in the room.
@@ -504,7 +564,7 @@ class EmoteEvent:
     receiver: User | None = None
 
 
-@define
+@define(eq=False)
 class ReactionEvent:
     """
     A reaction event, performed by a `user` in the room.
@@ -515,7 +575,7 @@ class ReactionEvent:
     receiver: User
 
 
-@define
+@define(eq=False)
 class UserJoinedEvent:
     """
     A user has joined the room.
@@ -525,7 +585,7 @@ class UserJoinedEvent:
     position: Position | AnchorPosition
 
 
-@define
+@define(eq=False)
 class UserLeftEvent:
     """
     A user has left the room.
@@ -534,7 +594,7 @@ class UserLeftEvent:
     user: User
 
 
-@define
+@define(eq=False)
 class ChannelEvent:
     """
     A hidden channel event.
@@ -545,7 +605,7 @@ class ChannelEvent:
     tags: list[str] = Factory(list)
 
 
-@define
+@define(eq=False)
 class TipReactionEvent:
     """
     The `sender` has sent `receiver` a tip (the `item`) in the current room.
@@ -556,7 +616,7 @@ class TipReactionEvent:
     item: Item | CurrencyItem
 
 
-@define
+@define(eq=False)
 class UserMovedEvent:
     """
     A user has moved in the room.
@@ -568,7 +628,7 @@ class UserMovedEvent:
     position: Position | AnchorPosition
 
 
-@define
+@define(eq=False)
 class VoiceEvent:
     """
     Event that is sent when status of voice is changed in the room.
@@ -577,11 +637,11 @@ class VoiceEvent:
     seconds_left: The number of seconds left until the voice chat ends.
     """
 
-    users: list[tuple[User, Literal["voice", "muted"]]]
+    users: list[tuple[User, VoiceStatus]]
     seconds_left: int
 
 
-@define
+@define(eq=False)
 class MessageEvent:
     """
     A message event, indicating that bot has received a message from someone. If the message is from a new conversation,
@@ -593,7 +653,7 @@ class MessageEvent:
     is_new_conversation: bool
 
 
-@define
+@define(eq=False)
 class RoomModeratedEvent:
     """A moderation event happened in room. This event is sent when a user is muted, unmuted, kicked, banned or unbanned.
     Muted and banned events can also have duration field which indicates how long the user is muted or banned for.
@@ -601,39 +661,46 @@ class RoomModeratedEvent:
 
     moderatorId: str
     targetUserId: str
-    moderationType: Literal["kick", "mute", "unmute", "ban", "unban"]
+    moderationType: ModerationType
     duration: int | None
 
 
-@define
-class CheckVoiceChatRequest:
+@define(eq=False)
+class CheckVoiceChatResponse:
     """
-    Check the voice chat status in the room.
+
+    Returns the status of voice chat in the room.
+    seconds_left: The number of seconds left until the voice chat ends.
+    auto_speakers: The list of users that automatically have voice chat privileges in the room like moderators and
+    owner.
+    users: The list of users that currently have voice chat privileges in the room.
+
     """
 
+    seconds_left: int
+    auto_speakers: set[str]
+    users: dict[str, Literal["invited", "voice", "muted"]]
     rid: str | None = None
 
-    @define
-    class CheckVoiceChatResponse:
-        """
 
-        Returns the status of voice chat in the room.
-        seconds_left: The number of seconds left until the voice chat ends.
-        auto_speakers: The list of users that automatically have voice chat privileges in the room like moderators and
-        owner.
-        users: The list of users that currently have voice chat privileges in the room.
-
-        """
+@define(eq=False)
+class CheckVoiceChatRequest:
+    """
+    Check the voice chat status in the room.
+    """
 
-        seconds_left: int
-        auto_speakers: set[str]
-        users: dict[str, Literal["invited", "voice", "muted"]]
-        rid: str | None = None
+    rid: str | None = None
 
+    CheckVoiceChatResponse: ClassVar = CheckVoiceChatResponse
     Response: ClassVar = CheckVoiceChatResponse
 
 
-@define
+@define(eq=False)
+class InviteSpeakerResponse:
+    rid: str | None = None
+
+
+@define(eq=False)
 class InviteSpeakerRequest:
     """
     Invite a user to speak in the room.
@@ -642,14 +709,16 @@ class InviteSpeakerRequest:
     user_id: str
     rid: str | None = None
 
-    @define
-    class InviteSpeakerResponse:
-        rid: str | None = None
-
+    InviteSpeakerResponse: ClassVar = InviteSpeakerResponse
     Response: ClassVar = InviteSpeakerResponse
 
 
-@define
+@define(eq=False)
+class RemoveSpeakerResponse:
+    rid: str | None = None
+
+
+@define(eq=False)
 class RemoveSpeakerRequest:
     """
     Remove a user from speaking in the room.
@@ -658,14 +727,21 @@ class RemoveSpeakerRequest:
     user_id: str
     rid: str | None = None
 
-    @define
-    class RemoveSpeakerResponse:
-        rid: str | None = None
-
+    RemoveSpeakerResponse: ClassVar = RemoveSpeakerResponse
     Response: ClassVar = RemoveSpeakerResponse
 
 
-@define
+@define(eq=False)
+class GetUserOutfitResponse:
+    """
+    The outfit of a user. Returns list of items user is currently wearing.
+    """
+
+    outfit: list[Item]
+    rid: str | None = None
+
+
+@define(eq=False)
 class GetUserOutfitRequest:
     """
     Get the outfit of a user.
@@ -674,19 +750,18 @@ class GetUserOutfitRequest:
     user_id: str
     rid: str | None = None
 
-    @define
-    class GetUserOutfitResponse:
-        """
-        The outfit of a user. Returns list of items user is currently wearing.
-        """
+    GetUserOutfitResponse: ClassVar = GetUserOutfitResponse
+    Response: ClassVar = GetUserOutfitResponse
 
-        outfit: list[Item]
-        rid: str | None = None
 
-    Response: ClassVar = GetUserOutfitResponse
+@define(eq=False)
+class GetConversationsResponse:
+    conversations: list[Conversation]
+    not_joined: int
+    rid: str | None = None
 
 
-@define
+@define(eq=False)
 class GetConversationsRequest:
     """
     Get the conversations of a bat. if not_joined is true, only get the conversations that bot has not joined yet will
@@ -698,16 +773,16 @@ class GetConversationsRequest:
     last_id: str | None = None
     rid: str | None = None
 
-    @define
-    class GetConversationsResponse:
-        conversations: list[Conversation]
-        not_joined: int
-        rid: str | None = None
-
+    GetConversationsResponse: ClassVar = GetConversationsResponse
     Response: ClassVar = GetConversationsResponse
 
 
-@define
+@define(eq=False)
+class SendMessageResponse:
+    rid: str | None = None
+
+
+@define(eq=False)
 class SendMessageRequest:
     """
     Send a message to a conversation. If bot wishes to send room invite, the room_id must be provided. If bot wishes to
@@ -721,14 +796,16 @@ class SendMessageRequest:
     world_id: str | None = None
     rid: str | None = None
 
-    @define
-    class SendMessageResponse:
-        rid: str | None = None
-
+    SendMessageResponse: ClassVar = SendMessageResponse
     Response: ClassVar = SendMessageResponse
 
 
-@define
+@define(eq=False)
+class SendBulkMessageResponse:
+    rid: str | None = None
+
+
+@define(eq=False)
 class SendBulkMessageRequest:
     """
     Send a message to a multiple users, with limit being 100. If bot wishes to send room invite, the room_id must
@@ -742,14 +819,17 @@ class SendBulkMessageRequest:
     world_id: str | None = None
     rid: str | None = None
 
-    @define
-    class SendBulkMessageResponse:
-        rid: str | None = None
-
+    SendBulkMessageResponse: ClassVar = SendBulkMessageResponse
     Response: ClassVar = SendBulkMessageResponse
 
 
-@define
+@define(eq=False)
+class GetMessagesResponse:
+    messages: list[Message]
+    rid: str | None = None
+
+
+@define(eq=False)
 class GetMessagesRequest:
     """
     Get the messages of a conversation.
@@ -761,15 +841,20 @@ class GetMessagesRequest:
     last_message_id: str | None = None
     rid: str | None = None
 
-    @define
-    class GetMessagesResponse:
-        messages: list[Message]
-        rid: str | None = None
-
+    GetMessagesResponse: ClassVar = GetMessagesResponse
     Response: ClassVar = GetMessagesResponse
 
 
-@define
+@define(eq=False)
+class LeaveConversationResponse:
+    """
+    The leave conversation success response.
+    """
+
+    rid: str | None = None
+
+
+@define(eq=False)
 class LeaveConversationRequest:
     """
     Leave a conversation.
@@ -778,35 +863,38 @@ class LeaveConversationRequest:
     conversation_id: str
     rid: str | None = None
 
-    @define
-    class LeaveConversationResponse:
-        """
-        The leave conversation success response.
-        """
+    LeaveConversationResponse: ClassVar = LeaveConversationResponse
+    Response: ClassVar = LeaveConversationResponse
 
-        rid: str | None = None
 
-    Response: ClassVar = LeaveConversationResponse
+@define(eq=False)
+class BuyVoiceTimeResponse:
+    """Buy a voice token."""
 
+    result: Literal["success", "insufficient_funds", "only_token_bought"]
+    rid: str | None = None
 
-@define
+
+@define(eq=False)
 class BuyVoiceTimeRequest:
     """Buy a voice time for a room."""
 
     payment_method: Literal["bot_wallet_only"]
     rid: str | None = None
 
-    @define
-    class BuyVoiceTimeResponse:
-        """Buy a voice token."""
+    BuyVoiceTimeResponse: ClassVar = BuyVoiceTimeResponse
+    Response: ClassVar = BuyVoiceTimeResponse
 
-        result: Literal["success", "insufficient_funds", "only_token_bought"]
-        rid: str | None = None
 
-    Response: ClassVar = BuyVoiceTimeResponse
+@define(eq=False)
+class BuyRoomBoostResponse:
+    """Buy a room boost."""
+
+    result: Literal["success", "insufficient_funds", "only_token_bought"]
+    rid: str | None = None
 
 
-@define
+@define(eq=False)
 class BuyRoomBoostRequest:
     """Buy a room boost."""
 
@@ -814,88 +902,80 @@ class BuyRoomBoostRequest:
     amount: int = 1
     rid: str | None = None
 
-    @define
-    class BuyRoomBoostResponse:
-        """Buy a room boost."""
+    BuyRoomBoostResponse: ClassVar = BuyRoomBoostResponse
+    Response: ClassVar = BuyRoomBoostResponse
 
-        result: Literal["success", "insufficient_funds", "only_token_bought"]
-        rid: str | None = None
 
-    Response: ClassVar = BuyRoomBoostResponse
+@define(eq=False)
+class TipUserResponse:
+    """Tip a user."""
 
+    result: Literal["success", "insufficient_funds"]
+    rid: str | None = None
 
-@define
+
+@define(eq=False)
 class TipUserRequest:
     """Tip a user."""
 
     user_id: str
-    gold_bar: Literal[
-        "gold_bar_1",
-        "gold_bar_5",
-        "gold_bar_10",
-        "gold_bar_50",
-        "gold_bar_100",
-        "gold_bar_500",
-        "gold_bar_1k",
-        "gold_bar_5000",
-        "gold_bar_10k",
-    ]
-    rid: str | None = None
-
-    @define
-    class TipUserResponse:
-        """Tip a user."""
-
-        result: Literal["success", "insufficient_funds"]
-        rid: str | None = None
+    gold_bar: GoldBar
+    rid: str | None = None
 
+    TipUserResponse: ClassVar = TipUserResponse
     Response: ClassVar = TipUserResponse
 
 
-@define
-class GetInventoryRequest:
+@define(eq=False)
+class GetInventoryResponse:
     """Get the inventory of a bot."""
 
+    items: list[Item]
     rid: str | None = None
 
-    @define
-    class GetInventoryResponse:
-        """Get the inventory of a bot."""
 
-        items: list[Item]
-        rid: str | None = None
+@define(eq=False)
+class GetInventoryRequest:
+    """Get the inventory of a bot."""
+
+    rid: str | None = None
 
+    GetInventoryResponse: ClassVar = GetInventoryResponse
     Response: ClassVar = GetInventoryResponse
 
 
-@define
+@define(eq=False)
+class SetOutfitResponse:
+    """Set the outfit of a bot."""
+
+    rid: str | None = None
+
+
+@define(eq=False)
 class SetOutfitRequest:
     """Set the outfit of a bot."""
 
     outfit: list[Item]
     rid: str | None = None
 
-    @define
-    class SetOutfitResponse:
-        """Set the outfit of a bot."""
+    SetOutfitResponse: ClassVar = SetOutfitResponse
+    Response: ClassVar = SetOutfitResponse
 
-        rid: str | None = None
 
-    Response: ClassVar = SetOutfitResponse
+@define(eq=False)
+class BuyItemResponse:
+    """Buy an item."""
 
+    result: Literal["success", "insufficient_funds"]
+    rid: str | None = None
 
-@define
+
+@define(eq=False)
 class BuyItemRequest:
     """Buy an item."""
 
     item_id: str
     rid: str | None = None
 
-    @define
-    class BuyItemResponse:
-        """Buy an item."""
-
-        result: Literal["success", "insufficient_funds"]
-        rid: str | None = None
-
+    BuyItemResponse: ClassVar = BuyItemResponse
     Response: ClassVar = BuyItemResponse
@@ -1,10 +1,15 @@
 from attrs import define
-from cattrs.preconf.json import make_converter
 
-from ._unions import configure_tagged_union
+from ._unions import configure_optional_unions, configure_tagged_union
 from .models import KeepaliveRequest
 
-converter = make_converter()
+try:
+    from cattrs.preconf.orjson import make_converter
+except ImportError:
+    from cattrs.preconf.json import make_converter  # type: ignore[assignment]
+
+converter = make_converter(detailed_validation=False)
+configure_optional_unions(converter)
 
 
 @define
@@ -13,14 +18,14 @@ class ControlSessionMetadata:
     instance_ids: list[str]
 
 
-@define
+@define(eq=False)
 class InstanceStartedEvent:
     """A room instance has been spawned."""
 
     instance_id: str
 
 
-@define
+@define(eq=False)
 class InstanceStoppedEvent:
     """A room instance has been stopped."""
 
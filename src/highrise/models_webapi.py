@@ -161,7 +161,7 @@ class OutfitItemColors:
     linked_colors: str = ""
 
 
-@define
+@define(weakref_slot=False)
 class OutfitItem:
     item_id: str
     name: str
@@ -222,11 +222,11 @@ class Room:
     access_policy: str
     category: str
     owner_id: str
-    locale: list[str] = []
+    locale: list[str] = Factory(list)
     is_home_room: bool | None = None
     num_connected: int = 0
-    moderator_ids: list[str] = []
-    designer_ids: list[str] = []
+    moderator_ids: list[str] = Factory(list)
+    designer_ids: list[str] = Factory(list)
     description: str | None = None
     crew_id: str | None = None
     bots: str | None = None
@@ -244,10 +244,10 @@ class RoomBasic:
     owner_id: str
     created_at: str
     access_policy: str
-    locale: list[str] = []
+    locale: list[str] = Factory(list)
     is_home_room: bool | None = None
-    designer_ids: list[str] = []
-    moderator_ids: list[str] = []
+    designer_ids: list[str] = Factory(list)
+    moderator_ids: list[str] = Factory(list)
 
 
 @define
@@ -260,7 +260,7 @@ class Comment:
     num_likes: int
 
 
-@define
+@define(weakref_slot=False)
 class PostItem:
     item_id: str
     active_palette: int = 0
@@ -279,7 +279,7 @@ class PostBody:
 
 
 @define
-class Post:
+class PostBasic:
     post_id: str
     author_id: str | None = None
     created_at: str | None = None
@@ -291,27 +291,15 @@ class Post:
     num_reposts: int = 0
     body: PostBody | None = None
     caption: str | None = None
-    featured_user_ids: list[str] = []
-    comments: list[Comment] = []
+    featured_user_ids: list[str] = Factory(list)
 
 
 @define
-class PostBasic:
-    post_id: str
-    author_id: str | None = None
-    created_at: str | None = None
-    file_key: str | None = None
-    type: str | None = None
-    visibility: str = "private"
-    num_comments: int = 0
-    num_likes: int = 0
-    num_reposts: int = 0
-    body: PostBody | None = None
-    caption: str | None = None
-    featured_user_ids: list[str] = []
+class Post(PostBasic):
+    comments: list[Comment] = Factory(list)
 
 
-@define
+@define(weakref_slot=False)
 class SkinPart:
     bone: str
     slot: str
@@ -328,21 +316,21 @@ class Item:
     acquisition_amount: int | None = None
     acquisition_currency: str | None = None
     category: ItemCategory | None = None
-    color_linked_categories: list[str] = []
-    color_palettes: list[str] = []
+    color_linked_categories: list[str] = Factory(list)
+    color_palettes: list[str] = Factory(list)
     created_at: DateTime | None = None
     description_key: str | None = None
     gems_sale_price: int | None = None
-    inspired_by: list[str] = []
+    inspired_by: list[str] = Factory(list)
     is_purchasable: bool = False
     is_tradable: bool = False
     image_url: str | None = None
     icon_url: str | None = None
-    link_ids: list[str] = []
-    m_dependent_colors: list[tuple[ItemCategory, int, int]] = []
-    m_front_skin_part_list: list[SkinPart] = []
-    m_back_skin_part_list: list[SkinPart] = []
-    m_hidden_skin_parts: set[str] = Factory(set)
+    link_ids: list[str] = Factory(list)
+    m_dependent_colors: list[tuple[ItemCategory, int, int]] = Factory(list)
+    m_front_skin_part_list: list[SkinPart] = Factory(list)
+    m_back_skin_part_list: list[SkinPart] = Factory(list)
+    m_hidden_skin_parts: frozenset[str] = frozenset()
     pops_sale_price: int | None = None
     rarity: Rarity = Rarity.NONE
     release_date: DateTime | None = None
@@ -353,21 +341,23 @@ class ItemBasic:
     item_id: str
     item_name: str
     category: ItemCategory | None = None
-    color_linked_categories: list[str] | None = []
-    color_palettes: list[str] | None = []
+    color_linked_categories: list[str] | None = Factory(list[str])
+    color_palettes: list[str] | None = Factory(list[str])
     created_at: DateTime | None = None
     description_key: str | None = None
     gems_sale_price: int | None = None
-    inspired_by: list[str] = []
+    inspired_by: list[str] = Factory(list)
     is_purchasable: bool = False
     is_tradable: bool = False
     image_url: str | None = None
     icon_url: str | None = None
-    link_ids: list[str] = []
-    m_dependent_colors: list[tuple[ItemCategory, int, int]] | None = []
-    m_front_skin_part_list: list[SkinPart] = []
-    m_back_skin_part_list: list[SkinPart] = []
-    m_hidden_skin_parts: set[str] = Factory(set)
+    link_ids: list[str] = Factory(list)
+    m_dependent_colors: list[tuple[ItemCategory, int, int]] | None = Factory(
+        list[tuple[ItemCategory, int, int]]
+    )
+    m_front_skin_part_list: list[SkinPart] = Factory(list)
+    m_back_skin_part_list: list[SkinPart] = Factory(list)
+    m_hidden_skin_parts: frozenset[str] = frozenset()
     pops_sale_price: int | None = None
     rarity: Rarity = Rarity.NONE
     release_date: DateTime | None = None
@@ -381,7 +371,7 @@ class Affiliation:
     event_type: str | None = None
 
 
-@define
+@define(weakref_slot=False)
 class RelatedItem:
     item_id: str
     disp_name: str
@@ -390,21 +380,21 @@ class RelatedItem:
 
 @define
 class RelatedItems:
-    affiliations: list[Affiliation] = []
-    items: list[RelatedItem] = []
+    affiliations: list[Affiliation] = Factory(list)
+    items: list[RelatedItem] = Factory(list)
 
 
 @define
 class Seller:
     user_id: str
     username: str
-    outfit: list[OutfitItem] = []
+    outfit: list[OutfitItem] = Factory(list)
     last_connected_at: DateTime | None = None
 
 
 @define
 class StorefrontListings:
-    sellers: list[Seller] = []
+    sellers: list[Seller] = Factory(list)
     pages: int = 0
     total: int = 0
 
@@ -440,13 +430,13 @@ class Reward:
 @define
 class LimitedKompuReward:
     expires_at: DateTime | None = None
-    rewards: list[Reward] = []
+    rewards: list[Reward] = Factory(list)
 
 
 @define
 class ProgressReward:
     rewards_at: int
-    rewards: list[Reward] = []
+    rewards: list[Reward] = Factory(list)
 
 
 @define
@@ -458,11 +448,11 @@ class Grab:
     banner_img_url: str
     starts_at: DateTime | None = None
     expires_at: DateTime | None = None
-    rewards: list[Reward] = []
+    rewards: list[Reward] = Factory(list)
     primary_img_url: str | None = None
     secondary_img_url: str | None = None
-    costs: list[Reward] = []
-    kompu_rewards: list[Reward] = []
+    costs: list[Reward] = Factory(list)
+    kompu_rewards: list[Reward] = Factory(list)
     is_tradable: bool = True
     limited_time_kompu: LimitedKompuReward | None = None
     progress_reward: ProgressReward | None = None
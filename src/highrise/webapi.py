@@ -1,10 +1,20 @@
+from __future__ import annotations
+
+from asyncio import Semaphore
+from datetime import datetime
+from enum import Enum
+from functools import lru_cache
 from os import environ
-from typing import Any, Literal, Type
+from sys import intern
+from typing import Any, Callable, Literal, Type, TypeVar
 
 from aiohttp import ClientSession
 from cattrs import Converter
-from pendulum import DateTime, parse
+from pendulum import DateTime, instance, parse
 
+from . import ResponseError
+from ._lookups import configure_enum_lookup
+from ._unions import configure_optional_unions
 from .models_webapi import (
     GetPublicGrabResponse,
     GetPublicGrabsResponse,
@@ -16,13 +26,89 @@ from .models_webapi import (
     GetPublicRoomsResponse,
     GetPublicUserResponse,
     GetPublicUsersResponse,
+    Item,
+    ItemBasic,
     ItemCategory,
+    LegacyRewardCategory,
+    NFIStrategy,
+    Rarity,
 )
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+
+@lru_cache(maxsize=4096)
+def _parse_datetime(ts: str) -> Any:
+    """Parse an ISO 8601 timestamp.
+
+    The stdlib parser is tried first since it is much faster than
+    `pendulum.parse`; anything it rejects still goes through pendulum.
+    Timestamps like `release_date` repeat across list responses, and the
+    parsed values are immutable, so they are cached.
+    """
+    try:
+        if ts.endswith("Z"):
+            # Naive datetimes are taken as UTC, like `pendulum.parse` does.
+            return instance(datetime.fromisoformat(ts[:-1]))
+        return instance(datetime.fromisoformat(ts))
+    except ValueError:
+        return parse(ts)
+
+
+def _configure_item_interning(converter: Converter) -> None:
+    """
+    Configure the converter so that the palette and linked category names on
+    `Item` and `ItemBasic` are interned after structuring.
+
+    These are a handful of names repeated across every item in a list
+    response, so equal values end up sharing one `str` object. The hooks are
+    generated when an item is first structured, like the others.
+    """
+
+    def gen_structure_and_intern(cl: Any) -> Callable[[Any, Any], Any]:
+        structure_item = converter.gen_structure_attrs_fromdict(cl)
+
+        def structure_and_intern(val: Any, t: Any) -> Any:
+            item = structure_item(val, t)
+            for names in (item.color_linked_categories, item.color_palettes):
+                if names:
+                    names[:] = map(intern, names)
+            return item
+
+        return structure_and_intern
+
+    converter.register_structure_hook_factory(
+        lambda t: t in (Item, ItemBasic), gen_structure_and_intern
+    )
+
+
 converter = Converter()
-converter.register_structure_hook(DateTime, lambda ts, _: parse(ts))
+configure_optional_unions(converter)
+converter.register_structure_hook(DateTime, lambda ts, _: _parse_datetime(ts))
+configure_enum_lookup(ItemCategory, converter)
+configure_enum_lookup(Rarity, converter)
+configure_enum_lookup(LegacyRewardCategory, converter)
+configure_enum_lookup(NFIStrategy, converter)
+_configure_item_interning(converter)
 
 SORT_OPTION = Literal["desc", "asc"]
+T = TypeVar("T")
+
+
+def _encode_params(**params: Any) -> dict[str, Any]:
+    """Build the query parameters for a list endpoint in a single pass.
+
+    Parameters set to `None` are left out and enum members are sent as their
+    values; the rest are URL-encoded by aiohttp.
+    """
+    return {
+        k: v.value if isinstance(v, Enum) else v
+        for k, v in params.items()
+        if v is not None
+    }
 
 
 class WebAPI:
@@ -33,9 +119,44 @@ class WebAPI:
 
     Each method corresponds to a specific endpoint on the Highrise API, and returns a
     structured response based on the response JSON and webapi models.
+
+    At most `max_connections` requests per instance are in flight at once, so
+    callers can `asyncio.gather` many `get_*` calls without flooding the API.
     """
 
     url: str = environ.get("HR_WEBAPI_URL", "https://webapi.highrise.game")
+    max_connections: int = 8
+    _session: ClientSession | None = None
+    _semaphore: Semaphore | None = None
+    _closed: bool = False
+
+    async def __aenter__(self) -> WebAPI:
+        """Open an HTTP session shared by all requests until the block exits.
+
+        Reusing one session keeps connections to the Web API alive between
+        requests instead of doing a new TCP and TLS handshake every time.
+        """
+        self._check_open()
+        if self._session is None:
+            self._session = ClientSession()
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the shared HTTP session, if one was opened.
+
+        The instance can't be used for requests afterwards.
+        """
+        self._closed = True
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise RuntimeError("WebAPI is closed")
 
     async def get_user(self, user_id: str) -> GetPublicUserResponse:
         """Fetch a single user given its user_id.
@@ -46,8 +167,7 @@ class WebAPI:
         Returns:
             GetPublicUserResponse: The public data of the user.
         """
-        endpoint = f"/users/{user_id}"
-        return await self.send_request(endpoint, GetPublicUserResponse)
+        return await self.send_request(f"/users/{user_id}", GetPublicUserResponse)
 
     async def get_users(
         self,
@@ -65,18 +185,15 @@ class WebAPI:
         Returns:
             GetPublicUsersResponse: A list of public data of users.
         """
-        params = {
-            "starts_after": starts_after,
-            "ends_before": ends_before,
-            "sort_order": sort_order,
-            "limit": limit,
-            "username": username,
-        }
-
-        params = {k: v for k, v in params.items() if v is not None}
+        params = _encode_params(
+            starts_after=starts_after,
+            ends_before=ends_before,
+            sort_order=sort_order,
+            limit=limit,
+            username=username,
+        )
 
-        endpoint = f"/users?{'&'.join(f'{k}={v}' for k, v in params.items())}"
-        return await self.send_request(endpoint, GetPublicUsersResponse)
+        return await self.send_request("/users", GetPublicUsersResponse, params)
 
     async def get_room(self, room_id: str) -> GetPublicRoomResponse:
         """Fetch a single room given its room_id.
@@ -87,8 +204,7 @@ class WebAPI:
         Returns:
             GetPublicRoomResponse: The public data of the room.
         """
-        endpoint = f"/rooms/{room_id}"
-        return await self.send_request(endpoint, GetPublicRoomResponse)
+        return await self.send_request(f"/rooms/{room_id}", GetPublicRoomResponse)
 
     async def get_rooms(
         self,
@@ -108,19 +224,16 @@ class WebAPI:
         Returns:
             GetPublicRoomsResponse: A list of public data of rooms.
         """
-        params = {
-            "starts_after": starts_after,
-            "ends_before": ends_before,
-            "sort_order": sort_order,
-            "limit": limit,
-            "room_name": room_name,
-            "owner_id": owner_id,
-        }
+        params = _encode_params(
+            starts_after=starts_after,
+            ends_before=ends_before,
+            sort_order=sort_order,
+            limit=limit,
+            room_name=room_name,
+            owner_id=owner_id,
+        )
 
-        params = {k: v for k, v in params.items() if v is not None}
-
-        endpoint = f"/rooms?{'&'.join(f'{k}={v}' for k, v in params.items())}"
-        return await self.send_request(endpoint, GetPublicRoomsResponse)
+        return await self.send_request("/rooms", GetPublicRoomsResponse, params)
 
     async def get_post(self, post_id: str) -> GetPublicPostResponse:
         """Fetch a single post given its post_id.
@@ -131,8 +244,7 @@ class WebAPI:
         Returns:
             GetPublicPostResponse: The public data of the post.
         """
-        endpoint = f"/posts/{post_id}"
-        return await self.send_request(endpoint, GetPublicPostResponse)
+        return await self.send_request(f"/posts/{post_id}", GetPublicPostResponse)
 
     async def get_posts(
         self,
@@ -150,18 +262,15 @@ class WebAPI:
         Returns:
             GetPublicPostsResponse: A list of public data of posts.
         """
-        params = {
-            "starts_after": starts_after,
-            "ends_before": ends_before,
-            "sort_order": sort_order,
-            "limit": limit,
-            "author_id": author_id,
-        }
-
-        params = {k: v for k, v in params.items() if v is not None}
+        params = _encode_params(
+            starts_after=starts_after,
+            ends_before=ends_before,
+            sort_order=sort_order,
+            limit=limit,
+            author_id=author_id,
+        )
 
-        endpoint = f"/posts?{'&'.join(f'{k}={v}' for k, v in params.items())}"
-        return await self.send_request(endpoint, GetPublicPostsResponse)
+        return await self.send_request("/posts", GetPublicPostsResponse, params)
 
     async def get_item(self, item_id: str) -> GetPublicItemResponse:
         """Fetch a single item given its item_id.
@@ -172,8 +281,7 @@ class WebAPI:
         Returns:
             GetPublicItemResponse: The public data of the item.
         """
-        endpoint = f"/items/{item_id}"
-        return await self.send_request(endpoint, GetPublicItemResponse)
+        return await self.send_request(f"/items/{item_id}", GetPublicItemResponse)
 
     async def get_items(
         self,
@@ -195,20 +303,17 @@ class WebAPI:
         Returns:
             GetPublicPostsResponse: A list of public data of posts.
         """
-        params = {
-            "starts_after": starts_after,
-            "ends_before": ends_before,
-            "sort_order": sort_order,
-            "limit": limit,
-            "rarity": rarity,
-            "item_name": item_name,
-            "category": category,
-        }
-
-        params = {k: v for k, v in params.items() if v is not None}
-
-        endpoint = f"/items?{'&'.join(f'{k}={v}' for k, v in params.items())}"
-        return await self.send_request(endpoint, GetPublicItemsResponse)
+        params = _encode_params(
+            starts_after=starts_after,
+            ends_before=ends_before,
+            sort_order=sort_order,
+            limit=limit,
+            rarity=rarity,
+            item_name=item_name,
+            category=category,
+        )
+
+        return await self.send_request("/items", GetPublicItemsResponse, params)
 
     async def get_grab(self, grab_id: str) -> GetPublicGrabResponse:
         """Fetch a single grab given its grab_id.
@@ -219,8 +324,7 @@ class WebAPI:
         Returns:
             GetPublicGrabResponse: The public data of the grab.
         """
-        endpoint = f"/grabs/{grab_id}"
-        return await self.send_request(endpoint, GetPublicGrabResponse)
+        return await self.send_request(f"/grabs/{grab_id}", GetPublicGrabResponse)
 
     async def get_grabs(
         self,
@@ -238,32 +342,49 @@ class WebAPI:
         Returns:
             GetPublicGrabsResponse: A list of public data of grabs.
         """
-        params = {
-            "starts_after": starts_after,
-            "ends_before": ends_before,
-            "sort_order": sort_order,
-            "limit": limit,
-            "title": title,
-        }
-
-        params = {k: v for k, v in params.items() if v is not None}
-
-        endpoint = f"/grabs?{'&'.join(f'{k}={v}' for k, v in params.items())}"
-        return await self.send_request(endpoint, GetPublicGrabsResponse)
-
-    async def send_request(self, endpoint: str, cl: Type[Any]) -> Any:
+        params = _encode_params(
+            starts_after=starts_after,
+            ends_before=ends_before,
+            sort_order=sort_order,
+            limit=limit,
+            title=title,
+        )
+
+        return await self.send_request("/grabs", GetPublicGrabsResponse, params)
+
+    async def send_request(
+        self, endpoint: str, cl: Type[T], params: dict[str, Any] | None = None
+    ) -> T:
         """
         Sends a request to the given endpoint and returns a structured response from webapi models.
 
+        `params` are passed to aiohttp as the query string, see `_encode_params`.
+        Outside of `async with WebAPI()`, a session is opened for this request only.
+        Either way, the request waits while `max_connections` others are in flight.
+
         Raises:
             ResponseError: If the response status is not 200.
+            RuntimeError: If the instance has been closed.
         """
-        async with ClientSession() as session:
-            async with session.get(f"{self.url}{endpoint}") as response:
-                from . import ResponseError
-
-                if response.status == 200:
-                    data = await response.json()
-                    return converter.structure(data, cl)
-                else:
-                    raise ResponseError((await response.read()).decode())
+        self._check_open()
+        if self._semaphore is None:
+            self._semaphore = Semaphore(self.max_connections)
+        async with self._semaphore:
+            if self._session is None:
+                async with ClientSession() as session:
+                    return await self._send_request(session, endpoint, cl, params)
+            return await self._send_request(self._session, endpoint, cl, params)
+
+    async def _send_request(
+        self,
+        session: ClientSession,
+        endpoint: str,
+        cl: Type[T],
+        params: dict[str, Any] | None,
+    ) -> T:
+        async with session.get(f"{self.url}{endpoint}", params=params) as response:
+            if response.status == 200:
+                data = await response.json(loads=json_loads)
+                return converter.structure(data, cl)
+            else:
+                raise ResponseError((await response.read()).decode())